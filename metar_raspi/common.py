@@ -2,6 +2,7 @@
 
 import json
 import logging
+from collections.abc import Sequence
 
 import metar_raspi.config as cfg
 
@@ -43,6 +44,7 @@ IDENT_CHARS = [
     "8",
     "9",
 ]
+IDENT_INDEX = {char: i for i, char in enumerate(IDENT_CHARS)}
 
 logger = logging.getLogger()
 logger.setLevel(cfg.log_level)
@@ -52,20 +54,14 @@ if cfg.log_file is not None:
     logger.addHandler(log_file)
 
 
-def ident_to_station(idents: list[int]) -> str:
+def ident_to_station(idents: Sequence[int]) -> str:
     """Converts 'ident' ints to station string."""
     return "".join([IDENT_CHARS[num] for num in idents])
 
 
-def station_to_ident(station: str) -> list[int]:
+def station_to_ident(station: str) -> bytearray:
     """Converts station string to 'ident' ints."""
-    ret = []
-    for char in station:
-        if char.isalpha():
-            ret.append(ord(char) - 65)
-        elif char.isdigit():
-            ret.append(ord(char) - 22)
-    return ret
+    return bytearray(IDENT_INDEX[char] for char in station.upper() if char in IDENT_INDEX)
 
 
 SESSION_PATH = cfg.LOC / "session.json"
@@ -37,14 +37,23 @@ class Color:
     PURPLE: ColorT = 150, 0, 255
     GRAY: ColorT = 60, 60, 60
 
+    # Name lookup table used by buttons. Kept in sync with the attributes by invert
+    _values: dict[str, ColorT]
+
+    def __init__(self) -> None:
+        self._values = {name: value for name, value in vars(Color).items() if name.isupper()}
+
     def __getitem__(self, key: str) -> ColorT:
         try:
-            color: ColorT = getattr(self, key)
-        except AttributeError as exc:
+            return self._values[key]
+        except KeyError as exc:
             msg = f"{key} is not a set color"
             raise KeyError(msg) from exc
-        else:
-            return color
+
+    def invert(self) -> None:
+        """Swap the black and white values."""
+        self.BLACK, self.WHITE = self.WHITE, self.BLACK
+        self._values["BLACK"], self._values["WHITE"] = self.BLACK, self.WHITE
 
 
 @dataclass
@@ -100,7 +109,8 @@ class FlightRulesLayout:
     na: tuple[ColorT, int]
 
     def __getitem__(self, key: str) -> tuple[ColorT, int]:
-        return getattr(self, key, self.na)
+        # Keys are report values like "MVFR" and "N/A" while the fields are lowercase
+        return getattr(self, key.lower().replace("/", ""), self.na)
 
     @classmethod
     def from_dict(cls, data: dict[str, int]) -> Self:
@@ -20,10 +20,12 @@ While on the main and station selection display
 Uses Adafruit RGB Negative 16x2 LCD - https://www.adafruit.com/product/1110
 """
 
-import os
+import re
+import subprocess
 import sys
-from collections.abc import Callable
-from time import sleep
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import monotonic, monotonic_ns, sleep
 from typing import TYPE_CHECKING, Self
 
 import Adafruit_CharLCD as LCD
@@ -44,6 +46,8 @@ replacements = [
     ["10SM", "UNLM"],
     ["9999", "UNLM"],
 ]
+REPLACE_TABLE = dict(replacements)
+REPLACE_PATTERN = re.compile("|".join(re.escape(src) for src in REPLACE_TABLE))
 
 
 FR_COLORS = {
@@ -55,16 +59,104 @@ FR_COLORS = {
 
 
 Coord = tuple[int, int]
+# Line1, Line2, and flight rules backlight color
+DisplayData = tuple[str, str, tuple[int, int, int] | None]
+
+# aviationweather.gov allows one request per minute to each endpoint
+MIN_FETCH_INTERVAL = 60
+# Seconds between fetches. A shorter update_interval would only be throttled
+FETCH_INTERVAL = max(MIN_FETCH_INTERVAL, cfg.update_interval)
+
+BUTTONS = (LCD.SELECT, LCD.RIGHT, LCD.DOWN, LCD.UP, LCD.LEFT)
+
+
+class ButtonState:
+    """Debounced state of a single plate button."""
+
+    __slots__ = ("changed", "level", "reported")
+
+    level: bool
+    changed: int
+    reported: bool
+
+    def __init__(self, now: int):
+        self.level = False
+        self.changed = now
+        self.reported = False
+
+
+class ButtonDebouncer:
+    """Debounces polled plate buttons into single press events.
+
+    The first read that differs from the debounced level is accepted
+    immediately, so a short tap between polls is not lost. Further changes
+    are then ignored for stable_us to swallow contact bounce.
+    """
+
+    __slots__ = ("_state", "lcd", "stable_ns")
+
+    lcd: LCD.Adafruit_CharLCDPlate
+    stable_ns: int
+    _state: dict[int, ButtonState]
+
+    def __init__(self, lcd: LCD.Adafruit_CharLCDPlate, pins: Iterable[int], stable_us: int = 20_000):
+        self.lcd = lcd
+        self.stable_ns = stable_us * 1000
+        now = monotonic_ns() - self.stable_ns
+        self._state = {pin: ButtonState(now) for pin in pins}
+
+    def _sample(self, pin: int) -> ButtonState:
+        """Reads a button and updates its debounced level."""
+        state = self._state[pin]
+        level = bool(self.lcd.is_pressed(pin))
+        now = monotonic_ns()
+        # Changes inside the lockout after the last accepted one are bounce
+        if level != state.level and now - state.changed >= self.stable_ns:
+            state.level, state.changed = level, now
+        return state
+
+    def held(self, pin: int) -> bool:
+        """Returns True while the button is pressed."""
+        return self._sample(pin).level
+
+    def pressed(self, pin: int) -> bool:
+        """Returns True once per physical press of the button."""
+        state = self._sample(pin)
+        edge = state.level and not state.reported
+        state.reported = state.level
+        return edge
 
 
 class METARPlate:
     """Controls LCD plate display and buttons."""
 
+    __slots__ = (
+        "_buttons",
+        "_display_cache",
+        "_executor",
+        "_last_fetch",
+        "_scroll_frames",
+        "_static_line",
+        "_update_future",
+        "cols",
+        "ident",
+        "lcd",
+        "metar",
+        "rows",
+    )
+
     metar: Metar
-    ident: list[str]
+    ident: bytearray
     lcd: LCD.Adafruit_CharLCDPlate
-    cols: int = 16
-    rows: int = 2
+    _buttons: ButtonDebouncer
+    _display_cache: tuple[str, DisplayData] | None
+    _scroll_frames: tuple[str | None, list[str]]
+    _static_line: tuple[int, str] | None
+    _executor: ThreadPoolExecutor
+    _update_future: Future | None
+    _last_fetch: float | None
+    cols: int
+    rows: int
 
     def __init__(self, station: str, size: Coord | None = None):
         logger.debug("Running init")
@@ -73,9 +165,15 @@ class METARPlate:
         except BadStation:
             self.metar = Metar("KJFK")
         self.ident = common.station_to_ident(station)
-        if size:
-            self.cols, self.rows = size
+        self.cols, self.rows = size or (16, 2)
         self.lcd = LCD.Adafruit_CharLCDPlate(cols=self.cols, lines=self.rows)
+        self._buttons = ButtonDebouncer(self.lcd, BUTTONS)
+        self._display_cache = None
+        self._scroll_frames = (None, [])
+        self._static_line = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._update_future = None
+        self._last_fetch = None
         self.clear()
 
     @property
@@ -98,20 +196,33 @@ class METARPlate:
 
     @property
     def pressed_select(self) -> bool:
-        """Returns True if the select button is pressed."""
-        return self.lcd.is_pressed(LCD.SELECT)
+        """Returns True if the select button was just pressed."""
+        return self._buttons.pressed(LCD.SELECT)
 
     @property
     def pressed_shutdown(self) -> bool:
         """Returns True if the shutdown buttons are pressed."""
-        return self.lcd.is_pressed(LCD.LEFT) and self.lcd.is_pressed(LCD.RIGHT)
+        return self._buttons.held(LCD.LEFT) and self._buttons.held(LCD.RIGHT)
 
     def clear(self, *, reset_backlight: bool = True) -> None:
         """Resets the display and backlight color."""
         if reset_backlight:
             self.lcd.set_backlight(1)
+        # Clearing also returns the cursor home
         self.lcd.clear()
-        self.lcd.set_cursor(0, 0)
+        self._static_line = None
+
+    def _write_screen(self, text: str, color: tuple[int, int, int] | None = None) -> None:
+        """Clears the display and writes a message with an optional backlight color."""
+        self.clear(reset_backlight=color is None)
+        if color:
+            self.lcd.set_color(*color)
+        self.lcd.message(text)
+
+    def _wait_release(self, *pins: int) -> None:
+        """Blocks until the given buttons are steadily released."""
+        while any(self._buttons.held(pin) for pin in pins):
+            sleep(self._buttons.stable_ns / 1e9)
 
     def __handle_select(self) -> None:
         """Select METAR station.
@@ -119,16 +230,14 @@ class METARPlate:
         """
         cursor_pos = 0
         selected = False
-        self.clear()
-        self.lcd.message("4-Digit METAR")
+        self._write_screen("4-Digit METAR")
         # Display default ident
-        for row in range(4):
-            self.lcd.set_cursor(row, 1)
-            self.lcd.message(IDENT_CHARS[self.ident[row]])
+        self.lcd.set_cursor(0, 1)
+        self.lcd.message(self.station)
         self.lcd.set_cursor(0, 1)
         self.lcd.show_cursor(True)
         # Allow finger to be lifted from select button
-        sleep(1)
+        self._wait_release(LCD.SELECT)
         # Selection loop
         while not selected:
             # Shutdown option
@@ -137,31 +246,29 @@ class METARPlate:
                 self.lcd_select()
                 return
             # Previous char
-            if self.lcd.is_pressed(LCD.UP):
-                index = self.ident[cursor_pos]
-                if index == 0:
-                    index = len(IDENT_CHARS)
-                self.ident[cursor_pos] = index - 1
+            if self._buttons.pressed(LCD.UP):
+                self.ident[cursor_pos] = (self.ident[cursor_pos] - 1) % len(IDENT_CHARS)
                 self.lcd.message(IDENT_CHARS[self.ident[cursor_pos]])
+                # Writing advances the LCD cursor, so move it back
+                self.lcd.set_cursor(cursor_pos, 1)
             # Next char
-            elif self.lcd.is_pressed(LCD.DOWN):
-                index = self.ident[cursor_pos] + 1
-                if index == len(IDENT_CHARS):
-                    index = 0
-                self.ident[cursor_pos] = index
+            elif self._buttons.pressed(LCD.DOWN):
+                self.ident[cursor_pos] = (self.ident[cursor_pos] + 1) % len(IDENT_CHARS)
                 self.lcd.message(IDENT_CHARS[self.ident[cursor_pos]])
+                self.lcd.set_cursor(cursor_pos, 1)
             # Move cursor right
-            elif self.lcd.is_pressed(LCD.RIGHT):
+            elif self._buttons.pressed(LCD.RIGHT):
                 if cursor_pos < 3:
                     cursor_pos += 1
+                    self.lcd.set_cursor(cursor_pos, 1)
             # Move cursor left
-            elif self.lcd.is_pressed(LCD.LEFT):
+            elif self._buttons.pressed(LCD.LEFT):
                 if cursor_pos > 0:
                     cursor_pos -= 1
+                    self.lcd.set_cursor(cursor_pos, 1)
             # Confirm ident
             elif self.pressed_select:
                 selected = True
-            self.lcd.set_cursor(cursor_pos, 1)
             sleep(cfg.button_interval)
         self.lcd.show_cursor(0)
 
@@ -170,21 +277,24 @@ class METARPlate:
         self.lcd.set_backlight(1)
         self.__handle_select()
         self.export_session()
+        # Cancel only stops a queued fetch. Dropping the reference is what keeps a
+        # fetch already running for the previous station from being used
+        if self._update_future:
+            self._update_future.cancel()
+            self._update_future = None
+        self._last_fetch = None
         self.metar = Metar(self.station)
-        self.clear()
-        self.lcd.message(f"{self.station} selected")
+        self._write_screen(f"{self.station} selected")
 
     def lcd_timeout(self) -> None:
         """Display timeout message and sleep."""
         logger.warning("Connection Timeout")
-        self.clear(True)
-        self.lcd.message("No connection\nCheck back soon")
+        self._write_screen("No connection\nCheck back soon")
         sleep(cfg.timeout_interval)
 
     def lcd_bad_station(self) -> None:
         """Display bad station message and sleep."""
-        self.clear()
-        self.lcd.message(f"No Weather Data\nFor {self.station}")
+        self._write_screen(f"No Weather Data\nFor {self.station}")
         sleep(3)
         self.lcd_select()
 
@@ -192,21 +302,20 @@ class METARPlate:
         """Display shutdown options."""
         selection = False
         selected = False
-        self.clear()
         msg = "Shutdown the Pi" if cfg.shutdown_on_exit else "Quit the program"
-        self.lcd.message(f"{msg}?\nY N")
+        self._write_screen(f"{msg}?\nY N")
         self.lcd.set_cursor(2, 1)
         self.lcd.show_cursor(True)
         # Allow finger to be lifted from LR buttons
-        sleep(1)
+        self._wait_release(LCD.LEFT, LCD.RIGHT)
         # Selection loop
         while not selected:
             # Move cursor right
-            if self.lcd.is_pressed(LCD.RIGHT) and selection:
+            if selection and self._buttons.pressed(LCD.RIGHT):
                 self.lcd.set_cursor(2, 1)
                 selection = False
             # Move cursor left
-            elif self.lcd.is_pressed(LCD.LEFT) and not selection:
+            elif not selection and self._buttons.pressed(LCD.LEFT):
                 self.lcd.set_cursor(0, 1)
                 selection = True
             # Confirm selection
@@ -216,14 +325,16 @@ class METARPlate:
         self.lcd.show_cursor(False)
         if not selection:
             return None
-        self.clear(False)
+        # Blank the display before handing off to the OS
+        self.clear(reset_backlight=False)
         self.lcd.set_backlight(0)
         if cfg.shutdown_on_exit:
-            os.system("shutdown -h now")  # noqa: S605, S607
+            subprocess.Popen(["shutdown", "-h", "now"], start_new_session=True)
+        self._executor.shutdown(wait=False, cancel_futures=True)
         sys.exit()
 
-    def create_display_data(self) -> None:
-        """Returns tuple of display data.
+    def create_display_data(self) -> DisplayData | None:
+        """Returns tuple of display data or None if the station has no report.
 
         Line1: IDEN HHMMZ FTRL
         Line2: Rest of METAR report
@@ -231,16 +342,20 @@ class METARPlate:
         """
         if not self.metar.data:
             self.lcd_bad_station()
-            return
+            return None
+        cache = self._display_cache
+        if cache is not None and cache[0] == self.metar.raw:
+            return cache[1]
         data: MetarData = self.metar.data
         time = data.time.repr[2:] if data.time else "----Z"
         line1 = f"{data.station} {time} {data.flight_rules}"
         line2 = data.raw.split(" ", 2)[-1]
         if not cfg.include_remarks:
             line2 = line2.replace(data.remarks, "").strip()
-        for src, rep in replacements:
-            line2 = line2.replace(src, rep).strip()
-        return line1, line2, FR_COLORS.get(data.flight_rules)
+        line2 = REPLACE_PATTERN.sub(lambda match: REPLACE_TABLE[match.group()], line2).strip()
+        display: DisplayData = line1, line2, FR_COLORS.get(data.flight_rules)
+        self._display_cache = (self.metar.raw, display)
+        return display
 
     def __scroll_button_check(self) -> bool:
         """Handles any pressed buttons during main display."""
@@ -255,54 +370,70 @@ class METARPlate:
         return False
 
     @staticmethod
-    def __sleep_with_input(up_to: int, handler: Callable, step: float = cfg.button_interval) -> float:
+    def __sleep_with_input(up_to: int, handler: Callable, step: float = cfg.button_interval) -> bool:
         """Sleep for a certain amount while checking an input handler.
 
-        Returns the elapsed time or None if interrupted.
+        Returns True if the handler interrupted the sleep.
         """
-        elapsed = 0
         for _ in range(int(up_to / step)):
             sleep(step)
-            elapsed += step
             if handler():
-                return
-        return elapsed
+                return True
+        return False
 
-    def scroll_line(self, line: str, handler: Callable, row: int = 1) -> tuple[float, bool]:
+    def scroll_line(self, line: str, handler: Callable, row: int = 1) -> bool:
         """Scroll a line on the display.
 
         Must be given a function to handle button presses.
 
-        Returns approximate time elapsed and main refresh boolean.
+        Returns True if the main display should be refreshed.
         """
-        elapsed = 0
-        if len(line) <= self.cols:
-            self.lcd.set_cursor(0, row)
-            self.lcd.message(line)
+        cols = self.cols
+        if len(line) <= cols:
+            # A line that fits is already on the display after the first pass
+            if (row, line) != self._static_line:
+                self.lcd.set_cursor(0, row)
+                self.lcd.message(line)
+                self._static_line = (row, line)
         else:
+            self._static_line = None
+            if line != self._scroll_frames[0]:
+                frames = [line[i : i + cols] for i in range(len(line) - cols + 1)]
+                self._scroll_frames = (line, frames)
+            frames = self._scroll_frames[1]
             self.lcd.set_cursor(0, row)
-            self.lcd.message(line[: self.cols])
-            try:
-                elapsed += self.__sleep_with_input(2, handler)
-            except TypeError:
-                return elapsed, True
-            for i in range(1, len(line) - (self.cols - 1)):
+            self.lcd.message(frames[0])
+            if self.__sleep_with_input(2, handler):
+                return True
+            for frame in frames[1:]:
                 self.lcd.set_cursor(0, row)
-                self.lcd.message(line[i : i + self.cols])
+                self.lcd.message(frame)
                 sleep(cfg.scroll_interval)
-                elapsed += cfg.scroll_interval
                 if handler():
-                    return elapsed, True
-        try:
-            elapsed += self.__sleep_with_input(2, handler)
-        except TypeError:
-            return elapsed, True
-        return elapsed, False
+                    return True
+        return self.__sleep_with_input(2, handler)
+
+    def start_update(self) -> Future | None:
+        """Start fetching the METAR data in the background if not already running.
+
+        Returns the pending fetch or None if the last fetch was too recent to start another.
+        """
+        if self._update_future is None:
+            if self._last_fetch is not None and monotonic() - self._last_fetch < FETCH_INTERVAL:
+                return None
+            self._update_future = self._executor.submit(self.metar.update)
+            self._last_fetch = monotonic()
+        return self._update_future
 
     def update_metar(self) -> bool:
-        """Update the METAR data and handle any errors."""
+        """Wait for the METAR update and handle any errors."""
+        # Keep the current report if it was fetched moments ago
+        future = self.start_update()
+        if future is None:
+            return True
+        self._update_future = None
         try:
-            self.metar.update()
+            future.result()
         except BadStation:
             self.lcd_bad_station()
         except ConnectionError:
@@ -313,20 +444,31 @@ class METARPlate:
         return True
 
     def lcd_main(self) -> None:
-        """Display data until the elapsed time exceeds the update interval."""
-        line1, line2, color = self.create_display_data()
+        """Display data until the update interval passes and the next report is fetched."""
+        display = self.create_display_data()
+        # A new station was picked instead, so fetch its report first
+        if display is None:
+            return
+        line1, line2, color = display
         logger.info("\t%s\n\t%s", line1, line2)
-        self.clear()
         # Set LCD color to match current flight rules
-        self.lcd.set_color(*color) if color else self.lcd.set_backlight(1)
-        elapsed = 0
-        self.lcd.message(line1)
-        # Scroll line2 until update interval exceeded
-        while elapsed < cfg.update_interval:
-            step, refresh = self.scroll_line(line2, handler=self.__scroll_button_check)
-            if refresh:
+        self._write_screen(line1, color)
+        # Scroll line2 until the next fetch starts. The throttle is measured from the last fetch
+        # so time spent fetching and drawing doesn't push back the next update
+        future = self.start_update()
+        while future is None:
+            if self.scroll_line(line2, handler=self.__scroll_button_check):
                 return
-            elapsed += step
+            future = self.start_update()
+        # Keep scrolling the current report while the new one is fetched
+        while not future.done():
+            if self.scroll_line(line2, handler=self.__scroll_update_check):
+                return
+
+    def __scroll_update_check(self) -> bool:
+        """Handles pressed buttons and stops scrolling once the update finishes."""
+        future = self._update_future
+        return self.__scroll_button_check() or future is None or future.done()
 
 
 def main() -> int:
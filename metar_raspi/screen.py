@@ -1,13 +1,15 @@
 """Display ICAO METAR weather data with a Raspberry Pi and touchscreen."""
 
 import asyncio as aio
+import io
 import math
+import subprocess
 import sys
 import time
 from collections.abc import Callable, Coroutine
-from copy import copy
+from contextlib import suppress
 from datetime import UTC, datetime
-from os import system
+from functools import cache, lru_cache
 from typing import Any, Self
 
 import pygame
@@ -19,7 +21,7 @@ from dateutil.tz import tzlocal
 import metar_raspi.config as cfg
 from metar_raspi import common
 from metar_raspi.common import IDENT_CHARS, logger
-from metar_raspi.layout import Color, Coord, Layout, SpChar
+from metar_raspi.layout import Color, ColorT, Coord, Layout, SpChar
 
 LAYOUT = Layout.from_file(cfg.layout_path)
 
@@ -27,16 +29,61 @@ LAYOUT = Layout.from_file(cfg.layout_path)
 # Init pygame and fonts
 pygame.init()
 ICON_PATH = cfg.LOC / "icons"
-FONT_PATH = str(ICON_PATH / "DejaVuSans.ttf")
-
-FONT_S1 = pygame.font.Font(FONT_PATH, LAYOUT.fonts.s1)
-FONT_S2 = pygame.font.Font(FONT_PATH, LAYOUT.fonts.s2)
-FONT_S3 = pygame.font.Font(FONT_PATH, LAYOUT.fonts.s3)
-FONT_M1 = pygame.font.Font(FONT_PATH, LAYOUT.fonts.m1)
-FONT_M2 = pygame.font.Font(FONT_PATH, LAYOUT.fonts.m2)
-FONT_L1 = pygame.font.Font(FONT_PATH, LAYOUT.fonts.l1)
+FONT_PATH = ICON_PATH / "DejaVuSans.ttf"
+# Read the font file once. Every font size parses it from memory
+FONT_DATA = FONT_PATH.read_bytes()
+# Number of thermometer icons. Each has a normal and inverted image
+THERM_LEVELS = 6
+
+
+@cache
+def load_font(size: int) -> pygame.font.Font:
+    """Returns the display font at a given size loaded from memory. Cached by size."""
+    return pygame.font.Font(io.BytesIO(FONT_DATA), size)
+
+
+FONT_S1 = load_font(LAYOUT.fonts.s1)
+FONT_S2 = load_font(LAYOUT.fonts.s2)
+FONT_S3 = load_font(LAYOUT.fonts.s3)
+FONT_M1 = load_font(LAYOUT.fonts.m1)
+FONT_M2 = load_font(LAYOUT.fonts.m2)
+FONT_L1 = load_font(LAYOUT.fonts.l1)
 if LAYOUT.fonts.l2:
-    FONT_L2 = pygame.font.Font(FONT_PATH, LAYOUT.fonts.l2)
+    FONT_L2 = load_font(LAYOUT.fonts.l2)
+
+# Drawn cloud layer graphs kept before the cache is reset
+CLOUD_GRAPH_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=512)
+def render(font: pygame.font.Font, text: str, color: ColorT, background: ColorT | None = None) -> pygame.Surface:
+    """Returns rendered text. Cached by font, text, color, and background.
+
+    Converted to the display's pixel format since cached text is blitted many times.
+    Text drawn over a flat color can pass it as background to get an opaque surface
+    """
+    if background is None:
+        return font.render(text, 1, color).convert_alpha()
+    return font.render(text, 1, color, background).convert()
+
+
+# Main screen number elements: (MetarData attr, MainLayout attr, large label, small label)
+NUMBER_FIELDS = (
+    ("altimeter", "altim", "Altm ", "ALT: "),
+    ("visibility", "vis", "Visb ", "VIS: "),
+)
+
+# Text which only changes with the palette: (font, text, color name)
+STATIC_LABELS: tuple[tuple[pygame.font.Font, str, str], ...] = (
+    (FONT_M2, "Fetching weather", "BLACK"),
+    (FONT_S3, "Calm", "BLACK"),
+    (FONT_S3, "VRB", "BLACK"),
+    (FONT_S3, "No Gust", "BLACK"),
+    (FONT_S3, "Clouds AGL", "BLACK"),
+    (FONT_S3, "Updated", "BLACK"),
+    (FONT_M2, "CLR", "BLUE"),
+    (FONT_L1, SpChar.CANCEL, "RED"),
+)
 
 
 def midpoint(p1: Coord, p2: Coord) -> Coord:
@@ -46,16 +93,41 @@ def midpoint(p1: Coord, p2: Coord) -> Coord:
 
 def centered(rendered_text: pygame.Surface, around: Coord) -> Coord:
     """Returns the top left point for rendered text at a center point."""
-    width, height = rendered_text.get_size()
-    return around[0] - width // 2 + 1, around[1] - height // 2 + 1
+    return around[0] - rendered_text.get_width() // 2 + 1, around[1] - rendered_text.get_height() // 2 + 1
+
+
+# Unit circle (x, y) offsets for each whole compass degree where 0 is straight up
+COMPASS_VECTORS = tuple(
+    (math.cos((deg - 90) * math.pi / 180), math.sin((deg - 90) * math.pi / 180)) for deg in range(360)
+)
 
 
 def radius_point(degree: int, center: Coord, radius: int) -> Coord:
     """Returns the degree point on the circumference of a circle."""
-    degree %= 360
-    x = center[0] + radius * math.cos((degree - 90) * math.pi / 180)
-    y = center[1] + radius * math.sin((degree - 90) * math.pi / 180)
-    return int(x), int(y)
+    dx, dy = COMPASS_VECTORS[degree % 360]
+    return int(center[0] + radius * dx), int(center[1] + radius * dy)
+
+
+def relative_humidity(temp: int, dew: int) -> int:
+    """Returns the truncated relative humidity percentage from temperature and dewpoint.
+
+    The shared 6.11 vapor pressure factor cancels out, leaving a single power of ten
+    """
+    return int(100 * 10.0 ** (7.5 * dew / (237.7 + dew) - 7.5 * temp / (237.7 + temp)))
+
+
+def icon_surface(radius: int) -> tuple[pygame.Surface, Coord]:
+    """Returns a transparent surface for a round button icon and its center point.
+
+    A pixel of margin keeps the circle edge inside the surface
+    """
+    side = radius * 2 + 2
+    return pygame.Surface((side, side), pygame.SRCALPHA).convert_alpha(), (radius + 1, radius + 1)
+
+
+def icon_topleft(center: Coord, radius: int) -> Coord:
+    """Returns where to blit a round button icon made by icon_surface."""
+    return center[0] - radius - 1, center[1] - radius - 1
 
 
 def hide_mouse() -> None:
@@ -99,6 +171,9 @@ class RectButton(Button):
     width: int
     height: int
 
+    # Click bounds
+    rect: pygame.Rect
+
     # Box outline thickness
     thickness: int
 
@@ -114,6 +189,7 @@ class RectButton(Button):
         self.x1, self.y1, self.width, self.height = bounds
         self.x2 = self.x1 + self.width
         self.y2 = self.y1 + self.height
+        self.rect = pygame.Rect(bounds)
         self.onclick = action
         self.text = text
         self.fontsize = fontsize
@@ -129,8 +205,7 @@ class RectButton(Button):
             bounds = ((self.x1, self.y1), (self.width, self.height))
             pygame.draw.rect(win, color[self.fontcolor], bounds, self.thickness)
         if self.text is not None:
-            font = pygame.font.Font(FONT_PATH, self.fontsize)
-            rendered = font.render(self.text, 1, color[self.fontcolor])
+            rendered = render(load_font(self.fontsize), self.text, color[self.fontcolor])
             rwidth, rheight = rendered.get_size()
             x = self.x1 + (self.width - rwidth) / 2
             y = self.y1 + (self.height - rheight) / 2 + 1
@@ -138,7 +213,7 @@ class RectButton(Button):
 
     def is_clicked(self, pos: Coord) -> bool:
         """Returns True if the position is within the button bounds."""
-        return self.x1 < pos[0] < self.x2 and self.y1 < pos[1] < self.y2
+        return bool(self.rect.collidepoint(pos))
 
 
 class RoundButton(Button):
@@ -161,8 +236,9 @@ class RoundButton(Button):
 
     def is_clicked(self, pos: Coord) -> bool:
         """Returns True if the position is within the button bounds."""
-        x, y = self.center
-        return self.radius > math.hypot(x - pos[0], y - pos[1])
+        # Compare squared distances to skip the square root
+        dx, dy = self.center[0] - pos[0], self.center[1] - pos[1]
+        return dx * dx + dy * dy < self.radius * self.radius
 
 
 class IconButton(RoundButton):
@@ -207,8 +283,7 @@ class IconButton(RoundButton):
         if self.fill is not None:
             pygame.draw.circle(win, color[self.fill], self.center, self.radius)
         if self.icon is not None:
-            font = pygame.font.Font(FONT_PATH, self.fontsize)
-            rendered = font.render(self.icon, 1, color[self.fontcolor])
+            rendered = render(load_font(self.fontsize), self.icon, color[self.fontcolor])
             win.blit(rendered, centered(rendered, self.center))
 
 
@@ -218,13 +293,22 @@ class ShutdownButton(RoundButton):
     fontcolor: str = "WHITE"
     fill: str = "RED"
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def render_icon(radius: int, fill: ColorT, fontcolor: ColorT) -> pygame.Surface:
+        """Returns the drawn button. Cached by radius and colors."""
+        icon, center = icon_surface(radius)
+        pygame.draw.circle(icon, fill, center, radius)
+        pygame.draw.circle(icon, fontcolor, center, radius - 6)
+        pygame.draw.circle(icon, fill, center, radius - 9)
+        rect = ((center[0] - 2, center[1] - 10), (4, 20))
+        pygame.draw.rect(icon, fontcolor, rect)
+        return icon
+
     def draw(self, win: pygame.Surface, color: Color) -> None:
         """Draw the button on the window with the current color palette."""
-        pygame.draw.circle(win, color[self.fill], self.center, self.radius)
-        pygame.draw.circle(win, color[self.fontcolor], self.center, self.radius - 6)
-        pygame.draw.circle(win, color[self.fill], self.center, self.radius - 9)
-        rect = ((self.center[0] - 2, self.center[1] - 10), (4, 20))
-        pygame.draw.rect(win, color[self.fontcolor], rect)
+        icon = self.render_icon(self.radius, color[self.fill], color[self.fontcolor])
+        win.blit(icon, icon_topleft(self.center, self.radius))
 
 
 class SelectionButton(RoundButton):
@@ -233,15 +317,24 @@ class SelectionButton(RoundButton):
     fontcolor: str = "WHITE"
     fill: str = "GREEN"
 
-    def draw(self, win: pygame.Surface, color: Color) -> None:
-        """Draw the button on the window with the current color palette."""
-        pygame.draw.circle(win, color[self.fill], self.center, self.radius)
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def render_icon(radius: int, fill: ColorT, fontcolor: ColorT) -> pygame.Surface:
+        """Returns the drawn button. Cached by radius and colors."""
+        icon, center = icon_surface(radius)
+        pygame.draw.circle(icon, fill, center, radius)
         font = FONT_S3 if LAYOUT.large_display else FONT_M1
         for char, direction in ((SpChar.UP_TRIANGLE, -1), (SpChar.DOWN_TRIANGLE, 1)):
-            tri = font.render(char, 1, color[self.fontcolor])
-            topleft = list(centered(tri, self.center))
-            topleft[1] += int(self.radius * 0.5) * direction - 3
-            win.blit(tri, topleft)
+            tri = render(font, char, fontcolor)
+            topleft = list(centered(tri, center))
+            topleft[1] += int(radius * 0.5) * direction - 3
+            icon.blit(tri, topleft)
+        return icon
+
+    def draw(self, win: pygame.Surface, color: Color) -> None:
+        """Draw the button on the window with the current color palette."""
+        icon = self.render_icon(self.radius, color[self.fill], color[self.fontcolor])
+        win.blit(icon, icon_topleft(self.center, self.radius))
 
 
 class CancelButton(IconButton):
@@ -251,15 +344,21 @@ class CancelButton(IconButton):
     fill: str = "GRAY"
 
 
-def draw_func(func: Callable[["METARScreen"], None]) -> Callable[["METARScreen"], None]:
-    """Decorator wraps drawing functions with common commands."""
+def draw_func(func: Callable[["METARScreen"], pygame.Rect | None]) -> Callable[["METARScreen"], None]:
+    """Decorator wraps drawing functions with common commands.
+
+    Functions can return the area they drew to update just that part of the display
+    """
 
     def wrapper(screen: "METARScreen") -> None:
         screen.on_main = False
         screen.buttons = []
-        func(screen)
+        dirty = func(screen)
         screen.draw_buttons()
-        pygame.display.flip()
+        if dirty:
+            pygame.display.update(dirty)
+        else:
+            pygame.display.flip()
         # This line is a hack to force the screen to redraw
         pygame.event.get()
 
@@ -269,15 +368,26 @@ def draw_func(func: Callable[["METARScreen"], None]) -> Callable[["METARScreen"]
 class METARScreen:
     """Controls and draws UI elements."""
 
-    ident: list[int]
-    old_ident: list[int]
+    ident: bytearray
+    old_ident: bytearray
     width: int
     height: int
     win: pygame.Surface
     c: Color
     inverted: bool
     update_time: float
+    # Set whenever the update time changes so the update loop can reschedule
+    update_time_changed: aio.Event
     buttons: list[Button]
+    therm_icons: dict[tuple[bool, int], pygame.Surface]
+    # Pending (surface, point) pairs for the main screen's batched blit
+    blit_queue: list[tuple[pygame.Surface, tuple[float, float]]]
+    # Rendered cloud layer graphs keyed by (repr, base) of each layer
+    cloud_graphs: dict[tuple[tuple[str, int | None], ...], pygame.Surface]
+    # Main screen elements which only change with the palette. Keyed by inverted
+    main_backgrounds: dict[bool, pygame.Surface]
+    # Rendered flight rules text and its blit point keyed by flight rules. Colors don't change with the palette
+    flight_rules_text: dict[str, tuple[pygame.Surface, Coord]]
     layout: Layout
     is_large: bool
 
@@ -290,7 +400,7 @@ class METARScreen:
         except BadStation:
             self.metar = Metar("KJFK")
         self.ident = common.station_to_ident(station)
-        self.old_ident = copy(self.ident)
+        self.old_ident = self.ident[:]
         self.width, self.height = size
         if cfg.fullscreen:
             self.win = pygame.display.set_mode(size, pygame.FULLSCREEN)
@@ -299,13 +409,26 @@ class METARScreen:
         self.c = Color()
         self.inverted = inverted
         if inverted:
-            self.c.BLACK, self.c.WHITE = self.c.WHITE, self.c.BLACK
+            self.c.invert()
         if cfg.hide_mouse:
             hide_mouse()
+        # Touch drags flood the event queue with motion events which are never used
+        pygame.event.set_blocked((pygame.MOUSEMOTION, pygame.FINGERMOTION))
+        # Icons have transparency. Match the display's pixel format so blits skip per-pixel conversion
+        self.therm_icons = {
+            (invert, level): pygame.image.load(ICON_PATH / f"Therm{level}{'I' if invert else ''}.png").convert_alpha()
+            for invert in (False, True)
+            for level in range(THERM_LEVELS)
+        }
+        self.update_time_changed = aio.Event()
         self.reset_update_time()
         self.buttons = []
+        self.blit_queue = []
+        self.cloud_graphs = {}
         self.layout = LAYOUT
         self.is_large = self.layout.large_display
+        self.main_backgrounds = {}
+        self.prerender_palettes()
         logger.debug("Finished running init")
 
     @property
@@ -330,6 +453,7 @@ class METARScreen:
     def reset_update_time(self, interval: int | None = None) -> None:
         """Call to reset the update time to now plus the update interval."""
         self.update_time = time.time() + (interval or cfg.update_interval)
+        self.update_time_changed.set()
 
     async def refresh_data(self, *, force_main: bool = False, ignore_updated: bool = False) -> None:
         """Refresh existing station data."""
@@ -343,7 +467,7 @@ class METARScreen:
         except InvalidRequest:
             self.error_station()
         except Exception as exc:  # noqa: BLE001
-            logger.exception(f"An unknown error has occurred: {exc}")
+            logger.exception("An unknown error has occurred: %s", exc)
             self.error_unknown()
         else:
             logger.info(self.metar.raw)
@@ -369,12 +493,12 @@ class METARScreen:
         except InvalidRequest:
             self.error_station()
         except Exception as exc:  # noqa: BLE001
-            logger.exception(f"An unknown error has occurred: {exc}")
+            logger.exception("An unknown error has occurred: %s", exc)
             self.error_unknown()
         else:
             logger.info(new_metar.raw)
             self.metar = new_metar
-            self.old_ident = copy(self.ident)
+            self.old_ident = self.ident[:]
             self.reset_update_time()
             self.export_session()
             self.draw_main()
@@ -393,12 +517,33 @@ class METARScreen:
 
     def cancel_station(self) -> None:
         """Revert ident and redraw main screen."""
-        self.ident = self.old_ident
+        self.ident = self.old_ident[:]
         if self.metar.data is None:
             self.error_no_data()
         else:
             self.draw_main()
 
+    def prerender_palettes(self) -> None:
+        """Render the constant labels and main backgrounds for both palettes ahead of the first draw.
+
+        Inverting the display then only switches which cached surfaces are used
+        """
+        x, y = self.layout.main.flight_rules
+        self.flight_rules_text = {}
+        for flight_rules in ("VFR", "MVFR", "IFR", "LIFR", "N/A"):
+            fr_color, fr_x_offset = self.layout.flight_rules[flight_rules]
+            self.flight_rules_text[flight_rules] = render(FONT_M1, flight_rules, fr_color), (x + fr_x_offset, y)
+        for inverted in (False, True):
+            colors = Color()
+            if inverted:
+                colors.invert()
+            for font, text, color in STATIC_LABELS:
+                render(font, text, colors[color])
+            # Station selection glyphs so the first taps don't wait on the font renderer
+            for char in IDENT_CHARS:
+                render(FONT_L1, char, colors.BLACK, colors.WHITE)
+            self.main_backgrounds[inverted] = self.__render_main_background(colors)
+
     def draw_buttons(self) -> None:
         """Draw all current buttons."""
         for button in self.buttons:
@@ -421,7 +566,7 @@ class METARScreen:
             x = self.__selection_get_x(col)
             self.buttons.append(IconButton((x, upy), self.__incr_ident(col, down=True), SpChar.UP_TRIANGLE))
             self.buttons.append(IconButton((x, downy), self.__incr_ident(col, down=False), SpChar.DOWN_TRIANGLE))
-            rendered = FONT_L1.render(IDENT_CHARS[self.ident[col]], 1, self.c.BLACK)
+            rendered = render(FONT_L1, IDENT_CHARS[self.ident[col]], self.c.BLACK, self.c.WHITE)
             self.win.blit(rendered, centered(rendered, (x, chary)))
 
     def __selection_get_x(self, col: int) -> int:
@@ -436,25 +581,20 @@ class METARScreen:
         pos: 0-3 column
         down: increment/decrement counter
         """
+        # The character cell never moves, so build its integer bounds once
+        center = self.__selection_get_x(pos), self.layout.select.row_char
+        spacing = self.layout.select.col_spacing
+        region = pygame.Rect(0, 0, spacing, spacing)
+        region.center = center
+        step = -1 if down else 1
 
         def update_func() -> None:
             # Update ident
-            if down:
-                if self.ident[pos] == 0:
-                    self.ident[pos] = len(IDENT_CHARS)
-                self.ident[pos] -= 1
-            else:
-                self.ident[pos] += 1
-                if self.ident[pos] == len(IDENT_CHARS):
-                    self.ident[pos] = 0
+            self.ident[pos] = (self.ident[pos] + step) % len(IDENT_CHARS)
             # Update display
-            rendered = FONT_L1.render(IDENT_CHARS[self.ident[pos]], 1, self.c.BLACK)
-            x = self.__selection_get_x(pos)
-            chary = self.layout.select.row_char
-            spacing = self.layout.select.col_spacing
-            region = (x - spacing / 2, chary - spacing / 2, spacing, spacing)
+            rendered = render(FONT_L1, IDENT_CHARS[self.ident[pos]], self.c.BLACK, self.c.WHITE)
             pygame.draw.rect(self.win, self.c.WHITE, region)
-            self.win.blit(rendered, centered(rendered, (x, chary)))
+            self.win.blit(rendered, centered(rendered, center))
             pygame.display.update(region)
 
         return update_func
@@ -466,37 +606,40 @@ class METARScreen:
         self.on_main = True
         self.win.fill(self.c.WHITE)
         point = self.layout.error.line1
-        self.win.blit(FONT_M2.render("Fetching weather", 1, self.c.BLACK), point)
+        self.win.blit(render(FONT_M2, "Fetching weather", self.c.BLACK), point)
         point = self.layout.error.line2
-        self.win.blit(FONT_M2.render("data for " + self.station, 1, self.c.BLACK), point)
+        self.win.blit(render(FONT_M2, "data for " + self.station, self.c.BLACK), point)
 
-    def __draw_clock(self) -> None:
-        """Draw the clock components."""
+    def __draw_clock(self) -> pygame.Rect | None:
+        """Draw the clock components.
+
+        Returns the screen area that was drawn over
+        """
         if not (self.layout.main.clock and self.layout.main.clock_label):
-            return
+            return None
         now = datetime.now(UTC) if cfg.clock_utc else datetime.now(tzlocal())
         label = now.tzname() or "UTC"
         clock_font = globals().get("FONT_L2") or FONT_L1
-        clock_text = clock_font.render(now.strftime(cfg.clock_format), 1, self.c.BLACK)
+        clock_text = render(clock_font, now.strftime(cfg.clock_format), self.c.BLACK)
         x, y = self.layout.main.clock
         w, h = clock_text.get_size()
-        pygame.draw.rect(self.win, self.c.WHITE, ((x, y), (x + w, (y + h) * 0.9)))
-        self.win.blit(clock_text, (x, y))
+        dirty = pygame.draw.rect(self.win, self.c.WHITE, ((x, y), (x + w, (y + h) * 0.9)))
+        dirty.union_ip(self.win.blit(clock_text, (x, y)))
         label_font = FONT_M1 if self.is_large else FONT_S3
         point = self.layout.main.clock_label
-        self.win.blit(label_font.render(label, 1, self.c.BLACK), point)
+        dirty.union_ip(self.win.blit(render(label_font, label, self.c.BLACK), point))
+        return dirty
 
     def __draw_wind_compass(self, data: MetarData, center: Coord, radius: int) -> None:
         """Draw the wind direction compass."""
         wdir = data.wind_direction
         var = data.wind_variable_direction
-        pygame.draw.circle(self.win, self.c.GRAY, center, radius, 3)
         if data.wind_speed and not data.wind_speed.value:
-            text = FONT_S3.render("Calm", 1, self.c.BLACK)
+            text = render(FONT_S3, "Calm", self.c.BLACK)
         elif wdir and wdir.repr == "VRB":
-            text = FONT_S3.render("VRB", 1, self.c.BLACK)
+            text = render(FONT_S3, "VRB", self.c.BLACK)
         elif wdir and (wdir_value := wdir.value):
-            text = FONT_M1.render(str(wdir_value).zfill(3), 1, self.c.BLACK)
+            text = render(FONT_M1, str(wdir_value).zfill(3), self.c.BLACK)
             rad_point = radius_point(int(wdir_value), center, radius)
             width = 4 if self.is_large else 2
             pygame.draw.line(self.win, self.c.RED, center, rad_point, width)
@@ -506,8 +649,8 @@ class METARScreen:
                         rad_point = radius_point(int(point.value), center, radius)
                         pygame.draw.line(self.win, self.c.BLUE, center, rad_point, width)
         else:
-            text = FONT_L1.render(SpChar.CANCEL, 1, self.c.RED)
-        self.win.blit(text, centered(text, center))
+            text = render(FONT_L1, SpChar.CANCEL, self.c.RED)
+        self.blit_queue.append((text, centered(text, center)))
 
     def __draw_wind(self, data: MetarData, unit: str) -> None:
         """Draw the dynamic wind elements."""
@@ -516,12 +659,12 @@ class METARScreen:
         radius = self.layout.main.wind_compass_radius
         self.__draw_wind_compass(data, point, radius)
         if speed and speed.value:
-            rendered = FONT_S3.render(f"{speed.value} {unit}", 1, self.c.BLACK)
+            rendered = render(FONT_S3, f"{speed.value} {unit}", self.c.BLACK)
             point = self.layout.main.wind_speed
-            self.win.blit(rendered, centered(rendered, point))
+            self.blit_queue.append((rendered, centered(rendered, point)))
         text = f"G: {gust.value}" if gust else "No Gust"
-        rendered = FONT_S3.render(text, 1, self.c.BLACK)
-        self.win.blit(rendered, centered(rendered, self.layout.main.wind_gust))
+        rendered = render(FONT_S3, text, self.c.BLACK)
+        self.blit_queue.append((rendered, centered(rendered, self.layout.main.wind_gust)))
 
     def __draw_temp_icon(self, temp: int) -> None:
         """Draw the temperature icon."""
@@ -532,10 +675,10 @@ class METARScreen:
             therm_level = temp // 12 + 2
             if therm_level < 0:
                 therm_level = 0
-        add_i = "I" if self.inverted else ""
-        therm_icon = f"Therm{therm_level}{add_i}.png"
+            elif therm_level >= THERM_LEVELS:
+                therm_level = THERM_LEVELS - 1
         point = self.layout.main.temp_icon
-        self.win.blit(pygame.image.load(str(ICON_PATH / therm_icon)), point)
+        self.blit_queue.append((self.therm_icons[self.inverted, therm_level], point))
 
     def __draw_temp_dew_humidity(self, data: MetarData) -> None:
         """Draw the dynamic temperature, dewpoint, and humidity elements."""
@@ -554,7 +697,7 @@ class METARScreen:
         # Dewpoint
         dew_text += f"{dew.value}{SpChar.DEGREES}" if dew else "--"
         point = self.layout.main.dew
-        self.win.blit(FONT_S3.render(dew_text, 1, self.c.BLACK), point)
+        self.blit_queue.append((render(FONT_S3, dew_text, self.c.BLACK), point))
         # Temperature
         if temp and temp.value is not None:
             temp_text += f"{temp.value}{SpChar.DEGREES}"
@@ -567,61 +710,67 @@ class METARScreen:
             temp_text += "--"
             diff_text += "--"
         point = self.layout.main.temp
-        self.win.blit(FONT_S3.render(temp_text, 1, self.c.BLACK), point)
+        self.blit_queue.append((render(FONT_S3, temp_text, self.c.BLACK), point))
         point = self.layout.main.temp_stdv
-        self.win.blit(FONT_S3.render(diff_text, 1, self.c.BLACK), point)
+        self.blit_queue.append((render(FONT_S3, diff_text, self.c.BLACK), point))
         if temp and temp.value is not None and self.layout.main.temp_icon:
             self.__draw_temp_icon(int(temp.value))
         # Humidity
         if temp and dew and isinstance(temp.value, int) and isinstance(dew.value, int):
-            rel_humidity = (
-                (6.11 * 10.0 ** (7.5 * dew.value / (237.7 + dew.value)))
-                / (6.11 * 10.0 ** (7.5 * temp.value / (237.7 + temp.value)))
-                * 100
-            )
-            hmd_text += f"{int(rel_humidity)}%"
+            hmd_text += f"{relative_humidity(temp.value, dew.value)}%"
         else:
             hmd_text += "--"
         point = self.layout.main.humid
-        self.win.blit(FONT_S3.render(hmd_text, 1, self.c.BLACK), point)
+        self.blit_queue.append((render(FONT_S3, hmd_text, self.c.BLACK), point))
 
     def __draw_cloud_graph(self, clouds: list[Cloud], tl: Coord, br: Coord) -> None:
         """Draw cloud layers in chart.
 
-        Scales everything based on top left and bottom right points
+        Scales everything based on top left and bottom right points. The header and axis are on the main background
         """
         tlx, tly = tl
         brx, bry = br
-        header = FONT_S3.render("Clouds AGL", 1, self.c.BLACK)
-        header_height = header.get_size()[1]
-        header_point = midpoint(tl, (brx, tly + header_height))
-        self.win.blit(header, centered(header, header_point))
-        tly += header_height
-        pygame.draw.lines(self.win, self.c.BLACK, False, ((tlx, tly), (tlx, bry), (brx, bry)), 3)
+        tly += render(FONT_S3, "Clouds AGL", self.c.BLACK).get_height()
+        # Layers only change with a new report, so reuse the last drawn graph for the same clouds
+        layers = tuple((cloud.repr, cloud.base) for cloud in clouds)
+        graph = self.cloud_graphs.get(layers)
+        if graph is None:
+            if len(self.cloud_graphs) >= CLOUD_GRAPH_CACHE_SIZE:
+                self.cloud_graphs.clear()
+            graph = self.__render_cloud_layers(clouds, (brx - tlx, bry - tly))
+            self.cloud_graphs[layers] = graph
+        self.blit_queue.append((graph, (tlx, tly)))
+
+    def __render_cloud_layers(self, clouds: list[Cloud], size: Coord) -> pygame.Surface:
+        """Returns a transparent surface with cloud layers scaled to the graph size."""
+        width, height = size
+        # Extra height lets labels on the lowest layer hang below the axis like before
+        graph = pygame.Surface((width, height + FONT_S1.get_height()), pygame.SRCALPHA).convert_alpha()
         if not clouds:
-            text = FONT_M2.render("CLR", 1, self.c.BLUE)
-            self.win.blit(text, centered(text, midpoint((tlx, tly), (brx, bry))))
-            return
+            text = render(FONT_M2, "CLR", self.c.BLUE)
+            graph.blit(text, centered(text, midpoint((0, 0), size)))
+            return graph
         top = 80
         left_side = True
-        tlx += 5
-        brx -= 5
-        bry -= 10
+        left = 5
+        right = width - 5
+        bottom = height - 10
         for cloud in clouds[::-1]:
             if cloud.base:
                 if cloud.base > top:
                     top = cloud.base
-                draw_height = bry - (bry - tly) * cloud.base / top
-                text = FONT_S1.render(cloud.repr, 1, self.c.BLUE)
-                width, height = text.get_size()
-                liney = draw_height + height / 2
+                draw_height = bottom - bottom * cloud.base / top
+                text = render(FONT_S1, cloud.repr, self.c.BLUE)
+                text_width, text_height = text.get_size()
+                liney = draw_height + text_height / 2
                 if left_side:
-                    self.win.blit(text, (tlx, draw_height))
-                    pygame.draw.line(self.win, self.c.BLUE, (tlx + width + 2, liney), (brx, liney))
+                    graph.blit(text, (left, draw_height))
+                    pygame.draw.line(graph, self.c.BLUE, (left + text_width + 2, liney), (right, liney))
                 else:
-                    self.win.blit(text, (brx - width, draw_height))
-                    pygame.draw.line(self.win, self.c.BLUE, (tlx, liney), (brx - width - 2, liney))
+                    graph.blit(text, (right - text_width, draw_height))
+                    pygame.draw.line(graph, self.c.BLUE, (left, liney), (right - text_width - 2, liney))
                 left_side = not left_side
+        return graph
 
     def __draw_wx_raw(self) -> None:
         """Draw wx and raw report."""
@@ -654,51 +803,64 @@ class METARScreen:
         station = data.station or "----"
         tstamp = self.get_timestamp(data)
         if point := self.layout.main.title:
-            time_text = station + "  " + tstamp
-            self.win.blit(FONT_M1.render(time_text, 1, self.c.BLACK), point)
+            # Rendered in two parts so the station stays cached while the timestamp changes
+            station_text = render(FONT_M1, station + "  ", self.c.BLACK)
+            self.blit_queue.append((station_text, point))
+            time_point = point[0] + station_text.get_width(), point[1]
+            self.blit_queue.append((render(FONT_M1, tstamp, self.c.BLACK), time_point))
         elif point := self.layout.main.station:
-            self.win.blit(FONT_M1.render(station, 1, self.c.BLACK), point)
+            self.blit_queue.append((render(FONT_M1, station, self.c.BLACK), point))
             if self.is_large and (point := self.layout.main.timestamp_label):
-                self.win.blit(FONT_S3.render("Updated", 1, self.c.BLACK), point)
+                self.blit_queue.append((render(FONT_S3, "Updated", self.c.BLACK), point))
             else:
                 tstamp = "TS: " + tstamp
             if point := self.layout.main.timestamp:
-                self.win.blit(FONT_S3.render(tstamp, 1, self.c.BLACK), point)
+                self.blit_queue.append((render(FONT_S3, tstamp, self.c.BLACK), point))
 
     def __draw_flight_rules(self, flight_rules: str) -> None:
         """Draw the current flight rules."""
-        fr_color, fr_x_offset = self.layout.flight_rules[flight_rules]
-        point = list(self.layout.main.flight_rules)
-        point[0] += fr_x_offset
-        self.win.blit(FONT_M1.render(flight_rules, 1, fr_color), point)
-
-    def __draw_altimeter(self, altim: Number | None) -> None:
-        """Draw the altimeter setting."""
-        text = "Altm " if self.is_large else "ALT: "
-        text += str(altim.value) if altim else "--"
-        point = self.layout.main.altim
-        self.win.blit(FONT_S3.render(text, 1, self.c.BLACK), point)
-
-    def __draw_visibility(self, vis: Number | None) -> None:
-        """Draw the visibility."""
-        text = "Visb " if self.is_large else "VIS: "
-        text += str(vis.value) if vis else "--"
-        point = self.layout.main.vis
-        self.win.blit(FONT_S3.render(text, 1, self.c.BLACK), point)
+        text = self.flight_rules_text.get(flight_rules) or self.flight_rules_text["N/A"]
+        self.blit_queue.append(text)
+
+    def __draw_number_fields(self, data: MetarData) -> None:
+        """Draw the simple labeled number elements like altimeter and visibility."""
+        for data_key, layout_key, large_label, small_label in NUMBER_FIELDS:
+            number: Number | None = getattr(data, data_key)
+            text = large_label if self.is_large else small_label
+            text += str(number.value) if number else "--"
+            point = getattr(self.layout.main, layout_key)
+            self.blit_queue.append((render(FONT_S3, text, self.c.BLACK), point))
+
+    def __render_main_background(self, colors: Color) -> pygame.Surface:
+        """Returns the main screen elements which don't depend on the report."""
+        background = pygame.Surface(self.layout.size)
+        background.fill(colors.WHITE)
+        center = self.layout.main.wind_compass
+        pygame.draw.circle(background, colors.GRAY, center, self.layout.main.wind_compass_radius, 3)
+        (tlx, tly), (brx, bry) = self.layout.main.cloud_graph
+        header = render(FONT_S3, "Clouds AGL", colors.BLACK)
+        header_height = header.get_height()
+        header_point = midpoint((tlx, tly), (brx, tly + header_height))
+        background.blit(header, centered(header, header_point))
+        tly += header_height
+        pygame.draw.lines(background, colors.BLACK, False, ((tlx, tly), (tlx, bry), (brx, bry)), 3)
+        # Match the display pixel format so the per-refresh blit is a plain copy
+        return background.convert()
 
     def __main_draw_dynamic(self, data: MetarData, units: Units) -> None:
         """Load Main dynamic foreground elements.
 
-        Returns True if "Other-WX" or "Remarks" is not empty, else False
+        Text and icons are queued while shapes are drawn, then blitted together in one call
         """
         self.__draw_station_and_timestamp(data)
         self.__draw_flight_rules(data.flight_rules or "N/A")
         self.__draw_wind(data, units.wind_speed)
         self.__draw_temp_dew_humidity(data)
-        self.__draw_altimeter(data.altimeter)
-        self.__draw_visibility(data.visibility)
+        self.__draw_number_fields(data)
         top_left, bottom_right = self.layout.main.cloud_graph
         self.__draw_cloud_graph(data.clouds, top_left, bottom_right)
+        self.win.blits(self.blit_queue, doreturn=False)
+        self.blit_queue.clear()
 
     def __draw_text_lines(
         self,
@@ -712,9 +874,9 @@ class METARScreen:
     ) -> int:
         """Draw lines of text with header, columns, and line wrapping."""
         left_x, y = left_point
-        font = pygame.font.Font(FONT_PATH, fontsize) if fontsize else FONT_S2
+        font = load_font(fontsize) if fontsize else FONT_S2
         if header:
-            text = FONT_S3.render(header, 1, self.c.BLACK)
+            text = render(FONT_S3, header, self.c.BLACK)
             self.win.blit(text, left_point)
             y += text.get_size()[1] + space
         left = True
@@ -789,7 +951,7 @@ class METARScreen:
         if not (self.metar.data and self.metar.units):
             self.error_no_data()
             return
-        self.win.fill(self.c.WHITE)
+        self.win.blit(self.main_backgrounds[self.inverted], (0, 0))
         self.__main_draw_dynamic(self.metar.data, self.metar.units)
         self.buttons = [
             IconButton(
@@ -820,7 +982,7 @@ class METARScreen:
     def invert_wb(self, *, redraw: bool = True) -> None:
         """Invert the black and white of the display."""
         self.inverted = not self.inverted
-        self.c.BLACK, self.c.WHITE = self.c.WHITE, self.c.BLACK
+        self.c.invert()
         self.export_session()
         if redraw:
             self.draw_main()
@@ -833,12 +995,12 @@ class METARScreen:
         """
         self.win.fill(self.c.WHITE)
         text = "Shutdown the Pi?" if cfg.shutdown_on_exit else "Exit the program?"
-        rendered = FONT_M2.render(text, 1, self.c.BLACK)
+        rendered = render(FONT_M2, text, self.c.BLACK)
         point = self.width // 2, self.layout.quit.text_y
         self.win.blit(rendered, centered(rendered, point))
         pointy, pointn = self.layout.quit.yes, self.layout.quit.no
         self.buttons = [
-            IconButton(pointy, quit, SpChar.CHECKMARK, "WHITE", "GREEN"),
+            IconButton(pointy, shutdown, SpChar.CHECKMARK, "WHITE", "GREEN"),
             CancelButton(pointn, self.draw_main, fill="RED"),
         ]
 
@@ -853,16 +1015,19 @@ class METARScreen:
             ("github.com/devdupont/METAR-RasPi", "url", FONT_S1),
         ):
             point = self.width // 2, getattr(self.layout.info, key + "_y")
-            rendered = font.render(text, 1, self.c.BLACK)
+            rendered = render(font, text, self.c.BLACK)
             self.win.blit(rendered, centered(rendered, point))
         self.buttons = [CancelButton(action=self.draw_main)]
 
     @draw_func
-    def draw_options_bar(self) -> None:
-        """Draws options bar display."""
+    def draw_options_bar(self) -> pygame.Rect:
+        """Draws options bar display.
+
+        Returns the bar area to push to the display since the main screen stays behind it
+        """
         # Clear Option background
         height, width = self.layout.main.util_back
-        pygame.draw.rect(self.win, self.c.WHITE, ((0, height), (width, self.height)))
+        bar = pygame.draw.rect(self.win, self.c.WHITE, ((0, height), (width, self.height)))
         invchar = SpChar.SUN if self.inverted else SpChar.MOON
         btnx, btny = self.layout.util_pos
         spacing = self.layout.main.util_spacing
@@ -877,11 +1042,13 @@ class METARScreen:
             IconButton((get_x(3), btny), self.invert_wb, invchar, "WHITE", "BLACK"),
             IconButton((get_x(4), btny), self.draw_info_screen, SpChar.INFO, "WHITE", "PURPLE"),
         ]
+        return bar
 
     def update_clock(self) -> None:
         """Update just the clock on the screen."""
-        self.__draw_clock()
-        pygame.display.flip()
+        if dirty := self.__draw_clock():
+            # Only push the clock area instead of flipping the whole display
+            pygame.display.update(dirty)
         # This line is a hack to force the screen to redraw
         pygame.event.get()
 
@@ -889,9 +1056,9 @@ class METARScreen:
     def draw_no_network(self) -> None:
         """Display no network connection."""
         self.win.fill(self.c.WHITE)
-        self.win.blit(FONT_M2.render("Waiting for a", 1, self.c.BLACK), (25, 70))
-        self.win.blit(FONT_M2.render("network conn", 1, self.c.BLACK), (25, 120))
-        self.buttons = [ShutdownButton(self.layout.util_pos, quit)]
+        self.win.blit(render(FONT_M2, "Waiting for a", self.c.BLACK), (25, 70))
+        self.win.blit(render(FONT_M2, "network conn", self.c.BLACK), (25, 120))
+        self.buttons = [ShutdownButton(self.layout.util_pos, shutdown)]
 
     async def wait_for_network(self) -> None:
         """Sleep while waiting for a missing network."""
@@ -905,9 +1072,9 @@ class METARScreen:
         """Display an error message and cancel button."""
         self.win.fill(self.c.WHITE)
         point = self.layout.error.line1
-        self.win.blit(FONT_M2.render(line1, 1, self.c.BLACK), point)
+        self.win.blit(render(FONT_M2, line1, self.c.BLACK), point)
         point = self.layout.error.line2
-        self.win.blit(FONT_M2.render(line2, 1, self.c.BLACK), point)
+        self.win.blit(render(FONT_M2, line2, self.c.BLACK), point)
         self.buttons = [CancelButton(action=btnf)]
 
     @draw_func
@@ -946,17 +1113,23 @@ def shutdown() -> None:
     """Shutdown the program and optionally the system."""
     logger.debug("Quit")
     if cfg.shutdown_on_exit:
-        system("shutdown -h now")  # noqa: S605,S607
+        subprocess.Popen(["shutdown", "-h", "now"], start_new_session=True)
     sys.exit(0)
 
 
 async def update_loop(screen: METARScreen) -> None:
     """Handles updating the METAR data in the background."""
     while True:
-        if time.time() >= screen.update_time:
+        delay = screen.update_time - time.time()
+        if delay <= 0:
             logger.debug("Auto update")
             await screen.refresh_data()
-        await aio.sleep(10)
+            # Not every failed refresh moves the update time, so don't retry immediately
+            delay = max(screen.update_time - time.time(), 10)
+        # Sleep until the update is due or the update time is moved
+        screen.update_time_changed.clear()
+        with suppress(TimeoutError):
+            await aio.wait_for(screen.update_time_changed.wait(), delay)
 
 
 async def input_loop(screen: METARScreen) -> None:
@@ -964,7 +1137,7 @@ async def input_loop(screen: METARScreen) -> None:
     while True:
         for event in pygame.event.get():
             if event.type == pygame.MOUSEBUTTONDOWN:
-                pos = pygame.mouse.get_pos()
+                pos = event.pos
                 if cfg.hide_mouse:
                     hide_mouse()
                 for button in screen.buttons:
@@ -0,0 +1,104 @@
+"""LCD plate update scheduling tests."""
+
+import importlib
+from collections.abc import Iterator
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("Adafruit_CharLCD")
+pytest.importorskip("avwx")
+
+from metar_raspi import plate
+
+
+class FakeLCD:
+    """Records screen clears and never reports a pressed button."""
+
+    def __init__(self, cols: int, lines: int):
+        self.clears = 0
+
+    def clear(self) -> None:
+        self.clears += 1
+
+    def is_pressed(self, pin: int) -> bool:
+        return False
+
+    def set_backlight(self, *args: object) -> None: ...
+    def set_color(self, *args: object) -> None: ...
+    def set_cursor(self, *args: object) -> None: ...
+    def show_cursor(self, *args: object) -> None: ...
+    def message(self, *args: object) -> None: ...
+
+
+class FakeMetar:
+    """Counts fetches and always holds the same short report."""
+
+    def __init__(self, station: str):
+        self.fetches = 0
+        self.raw = f"{station} 161753Z 18010KT"
+        self.data = SimpleNamespace(
+            station=station,
+            time=SimpleNamespace(repr="161753Z"),
+            flight_rules="VFR",
+            raw=self.raw,
+            remarks="",
+        )
+
+    def update(self) -> bool:
+        self.fetches += 1
+        return True
+
+
+@pytest.fixture(params=[30, 600])
+def lcd_plate(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[tuple[plate.METARPlate, list[float]]]:
+    """Returns a plate on a fake clock with update_interval below and above the rate limit."""
+    # FETCH_INTERVAL is read from the config at import
+    monkeypatch.setattr(plate.cfg, "update_interval", request.param)
+    importlib.reload(plate)
+    now = [1000.0]
+
+    def fake_sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    monkeypatch.setattr(plate, "sleep", fake_sleep)
+    monkeypatch.setattr(plate, "monotonic", lambda: now[0])
+    monkeypatch.setattr(plate, "monotonic_ns", lambda: int(now[0] * 1e9))
+    monkeypatch.setattr(plate.LCD, "Adafruit_CharLCDPlate", FakeLCD)
+    monkeypatch.setattr(plate, "Metar", FakeMetar)
+    yield plate.METARPlate("KJFK"), now
+    monkeypatch.undo()
+    importlib.reload(plate)
+
+
+def test_fetch_interval_respects_rate_limit(lcd_plate: tuple[plate.METARPlate, list[float]]) -> None:
+    assert plate.FETCH_INTERVAL == max(plate.MIN_FETCH_INTERVAL, plate.cfg.update_interval)
+
+
+def test_main_waits_for_next_fetch(lcd_plate: tuple[plate.METARPlate, list[float]]) -> None:
+    lcd, clock = lcd_plate
+    assert lcd.update_metar()
+    assert lcd.metar.fetches == 1
+    start, clears = clock[0], lcd.lcd.clears
+    lcd.lcd_main()
+    # The screen is drawn once and scrolls until the throttle lets the next fetch start
+    assert lcd.lcd.clears == clears + 1
+    assert clock[0] - start >= plate.FETCH_INTERVAL
+    assert lcd.update_metar()
+    assert lcd.metar.fetches == 2
+
+
+def test_main_loop_does_not_spin(lcd_plate: tuple[plate.METARPlate, list[float]]) -> None:
+    lcd, clock = lcd_plate
+    start = clock[0]
+    cycles = 0
+    while clock[0] - start < 3 * plate.FETCH_INTERVAL:
+        assert lcd.update_metar()
+        lcd.lcd_main()
+        cycles += 1
+        # One redraw and fetch per interval, not one per loop
+        assert cycles <= 4
+    # lcd_main starts the fetch that the next update_metar picks up
+    assert lcd.metar.fetches == cycles + 1